@@ -0,0 +1,156 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Optional compiled runner for the schema program built by validator._compile_schema.
+Build in place with `cythonize -i _validate_c.pyx`; validator.py falls back to its
+generated Python validator when this extension is not available.
+
+Instructions are read by position, so the field order below must match validator._Instr;
+validator.py compares INSTR_FIELDS and INSTR_KINDS with its own layout on import and
+ignores a stale build.
+"""
+from cpython.dict cimport PyDict_GetItem
+from cpython.object cimport PyObject
+
+# instruction kinds, as in validator.py
+cdef enum:
+    OPTIONAL, REQUIRED, DICT, OPTIONAL_DICT, LIST, LIST_DICT
+
+# _Instr field positions
+cdef enum:
+    I_KIND, I_KEY, I_FIELD_PATH, I_FIELD_DESC, I_ALLOWED, I_CHECK, I_ELEM_TYPES, I_ELEM_CHECK, I_ELEM_EXACT, I_NONEMPTY, I_CHILDREN
+
+# the layout this module was built against, in the order of the enums above
+INSTR_FIELDS = ('kind', 'key', 'field_path', 'field_desc', 'allowed_types', 'check',
+                'elem_types', 'elem_check', 'elem_exact', 'needs_nonempty', 'children')
+INSTR_KINDS = (OPTIONAL, REQUIRED, DICT, OPTIONAL_DICT, LIST, LIST_DICT)
+
+
+cdef inline bint _type_ok(object val, object allowed):
+    # same predicate as validator._make_checker builds
+    if allowed is None:
+        return True
+    return isinstance(val, <tuple>allowed) and (type(val) is not bool or bool in <tuple>allowed)
+
+
+cdef object Violation   # record type, validator.Violation
+
+
+cdef str _join_path(object base, str field_path):
+    # same as validator._join_path
+    if not base:
+        return field_path
+    parent, list_path, i = <tuple>base
+    return f"{_join_path(parent, list_path)}[{i}].{field_path}"
+
+
+cdef inline int _add(list violations, object stop, str field, object desc, object exc) except -1:
+    # fail-fast runs raise *stop* at the first violation instead of recording it
+    if stop is not None:
+        raise stop
+    # tuple.__new__ skips the named tuple's Python-level __new__
+    violations.append(tuple.__new__(Violation, (field, desc, exc)))
+    return 0
+
+
+cdef int _run(tuple program, object data, list violations, object base, object stop) except -1:
+    cdef int kind
+    cdef bint nonempty
+    cdef PyObject* p
+    cdef Py_ssize_t i, n
+    cdef str field_path
+    cdef tuple ins
+    cdef object instr, key, val, desc, elem, elem_types
+
+    if not isinstance(data, dict):
+        _add(violations, stop, '/', "OPENEVAL ITEM IN JSON FORMAT", TypeError)
+        return 0
+
+    for instr in program:
+        ins = <tuple>instr   # unchecked cast, _Instr is a tuple subclass
+        kind = ins[I_KIND]
+        key = ins[I_KEY]
+        desc = ins[I_FIELD_DESC]
+        field_path = ins[I_FIELD_PATH]
+        nonempty = ins[I_NONEMPTY]
+        p = PyDict_GetItem(data, key)
+
+        if kind == OPTIONAL:
+            if p is NULL:
+                continue
+            # present but wrong type
+            val = <object>p
+            if val is not None and not _type_ok(val, ins[I_ALLOWED]):
+                _add(violations, stop, _join_path(base, field_path), desc, TypeError)
+
+        elif kind == REQUIRED:
+            # presence is 'required' or 'non-empty'
+            if p is NULL:
+                _add(violations, stop, _join_path(base, field_path), desc, KeyError)
+                continue
+            val = <object>p
+            if val is None:
+                if nonempty:
+                    _add(violations, stop, _join_path(base, field_path), desc, ValueError)
+                continue
+            if nonempty and isinstance(val, (str, list)) and len(val) == 0:
+                _add(violations, stop, _join_path(base, field_path), desc, ValueError)
+                continue
+            if not _type_ok(val, ins[I_ALLOWED]):
+                _add(violations, stop, _join_path(base, field_path), desc, TypeError)
+                continue
+            # for list[inner] dtypes, also validate inner element types
+            if ins[I_ELEM_CHECK] is not None:
+                elem_types = ins[I_ELEM_TYPES]
+                n = len(val)
+                for i in range(n):
+                    if not _type_ok(val[i], elem_types):
+                        _add(violations, stop, f"{_join_path(base, field_path)}[{i}]", desc, TypeError)
+
+        elif kind == DICT or kind == OPTIONAL_DICT:
+            if p is NULL:
+                if kind == OPTIONAL_DICT:
+                    continue
+                _add(violations, stop, _join_path(base, field_path), desc, KeyError)
+                continue
+            val = <object>p
+            if not isinstance(val, dict):
+                _add(violations, stop, _join_path(base, field_path), desc, TypeError)
+                continue
+            _run(ins[I_CHILDREN], val, violations, base, stop)
+
+        else:   # LIST or LIST_DICT
+            if p is NULL:
+                _add(violations, stop, _join_path(base, field_path), desc, KeyError)
+                continue
+            val = <object>p
+            if not isinstance(val, list):
+                _add(violations, stop, _join_path(base, field_path), desc, TypeError)
+                continue
+            n = len(<list>val)
+            if kind == LIST:
+                if nonempty and n == 0:
+                    _add(violations, stop, _join_path(base, field_path), desc, ValueError)
+                elem_types = ins[I_ELEM_TYPES]
+                for i in range(n):
+                    elem = (<list>val)[i]
+                    if elem is None:
+                        _add(violations, stop, f"{_join_path(base, field_path)}[{i}]", desc[0], ValueError)
+                    elif not _type_ok(elem, elem_types):
+                        _add(violations, stop, f"{_join_path(base, field_path)}[{i}]", desc[0], TypeError)
+            else:
+                if nonempty and n == 0:
+                    _add(violations, stop, _join_path(base, field_path), desc[0], ValueError)
+                for i in range(n):
+                    _run(ins[I_CHILDREN], (<list>val)[i], violations, (base, field_path, i), stop)
+    return 0
+
+
+def run(tuple program, object record, object data, list violations, object base="", object stop=None):
+    """
+    Run the compiled *program* and record violations found in *data* (see validator._generate_source),
+    as instances of *record* (validator.Violation). If *stop* is given, raise it at the
+    first violation instead (validator._BadEntry, fail-fast mode); *violations* may then be None.
+    """
+    global Violation
+    Violation = record
+    _run(program, data, violations, base, stop)
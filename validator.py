@@ -1,30 +1,161 @@
+import functools
+import hashlib
+import importlib.util
 import json
 import jsonlines
+import marshal
 import os
-from typing import Any
+from typing import Any, Callable, Iterator, NamedTuple
 import re
+import tempfile
+
+try:
+    # optional faster JSON parser for the schema
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # optional incremental JSON parser for validate_stream
+    import ijson
+except ImportError:
+    ijson = None
 
 _SCHEMA_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "item_schema.json")
+# on-disk cache of compiled validator bytecode, shared across CLI invocations
+_CACHE_DIR = os.path.join(os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+                          "openeval")
+# cached validators kept after a new one is written; older ones come from past schema,
+# generator or Python versions, or are another mode's and cheap to rebuild
+_CACHE_MAX_FILES = 16
 _schema_cache: dict | None = None
+_program_cache: tuple | None = None
+_validator_cache: dict[str, Callable[..., None]] = {}
 
 _TYPE_MAP = {'str': str, 'dict': dict, 'int': int, 'float': float, 'bool': bool}
 
 # dict-valued schema fields that are optional (may be absent entirely)
-_OPTIONAL_DICT_KEYS = {'contributor'}
+_OPTIONAL_DICT_KEYS = frozenset({'contributor'})
 
 # dict-template list fields that must be non-empty
-_NON_EMPTY_LIST_KEYS = {'responses', 'scores'}
+_NON_EMPTY_LIST_KEYS = frozenset({'responses', 'scores'})
+
+
+class Violation(NamedTuple):
+    """
+    A schema violation found in an entry.
+    field          - dot-path to the problematic key (e.g. 'item_metadata.contributor.email')
+    field_desc     - corresponding value of the problematic key in the schema
+    violation_type - exception class describing the problem
+    Violations used to be plain dicts with the same keys; v['field'] style access
+    still works, and to_dict() returns the old form.
+    """
+    field: str
+    field_desc: Any
+    violation_type: type
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            # only the record's fields, with the dict's KeyError for anything else
+            if key not in self._fields:
+                raise KeyError(key)
+            return getattr(self, key)
+        return tuple.__getitem__(self, key)
+
+    def to_dict(self) -> dict:
+        return {"field": self.field, "field_desc": self.field_desc, "violation_type": self.violation_type}
+
+
+class Violations:
+    """
+    Columnar (struct-of-arrays) buffer of violations, one list per Violation field,
+    which is smaller than one record per violation and can be aggregated column-wise.
+    items          - index of the entry each violation belongs to (see collect_violations)
+    fields         - Violation.field values
+    descs          - Violation.field_desc values
+    excs           - Violation.violation_type values
+    Iterating yields the Violation records.
+    """
+    __slots__ = ('items', 'fields', 'descs', 'excs')
+
+    def __init__(self) -> None:
+        self.items: list[int] = []
+        self.fields: list[str] = []
+        self.descs: list[Any] = []
+        self.excs: list[type] = []
+
+    def add(self, field: str, field_desc: Any, violation_type: type) -> None:
+        self.fields.append(field)
+        self.descs.append(field_desc)
+        self.excs.append(violation_type)
+
+    def __len__(self) -> int:
+        return len(self.fields)
+
+    def __iter__(self):
+        return map(Violation, self.fields, self.descs, self.excs)
+
+
+class _BadEntry(Exception):
+    """Raised by fail-fast validators at the first violation found in an entry."""
+
+
+# placeholder for absent keys, so presence and value take a single dict lookup
+_MISSING = object()
+
+# instruction kinds of the compiled schema program
+_OPTIONAL, _REQUIRED, _DICT, _OPTIONAL_DICT, _LIST, _LIST_DICT = range(6)
+
+
+class _Instr(NamedTuple):
+    """
+    One compiled schema field.
+    kind            - one of the instruction kinds above
+    key             - field name in the data dict
+    field_path      - dot-path to the field, relative to the enclosing list element (if any)
+    field_desc      - corresponding value of the key in the schema
+    allowed_types   - accepted types of the value, None for 'any'
+    check           - type predicate for the value, built once from allowed_types
+    elem_types      - accepted types of list elements, None if elements are not checked
+    elem_check      - type predicate for list elements, built once from elem_types
+    elem_exact      - frozenset of elem_types, for the all-exact-types fast path over a list
+    needs_nonempty  - whether an empty value is a violation
+    children        - compiled program of a nested mapping / list template
+    """
+    kind: int
+    key: str
+    field_path: str
+    field_desc: Any
+    allowed_types: tuple | None
+    check: Callable[[Any], bool]
+    elem_types: tuple | None
+    elem_check: Callable[[Any], bool] | None
+    elem_exact: frozenset | None
+    needs_nonempty: bool
+    children: tuple
 
 
 def _load_schema() -> dict:
     global _schema_cache
     if _schema_cache is None:
-        with open(_SCHEMA_PATH) as f:
-            _schema_cache = json.load(f)
+        if orjson is not None:
+            with open(_SCHEMA_PATH, 'rb') as f:
+                _schema_cache = orjson.loads(f.read())
+        else:
+            with open(_SCHEMA_PATH) as f:
+                _schema_cache = json.load(f)
     return _schema_cache
 
 
-def _parse_constraints(schema_str: str) -> list[str]:
+def _load_program() -> tuple:
+    global _program_cache
+    if _program_cache is None:
+        _program_cache = _compile_schema(_load_schema())
+    return _program_cache
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_constraints(schema_str: str) -> tuple[str, str]:
     """
     Extract dtype and presence constraints from a '[dtype | presense] ...' schema string.
     The dtype constraints specify the allowed data type(s) of the schema value.
@@ -33,151 +164,420 @@ def _parse_constraints(schema_str: str) -> list[str]:
         'optional'      - field may be absent, skip
         'required'      - field must be present but can be empty
         'non-empty'     - field must be present and non-empty
-    Returns [dtype_str, presence_str], e.g. ['str,dict', 'non-empty'].
+    Returns (dtype_str, presence_str), e.g. ('str,dict', 'non-empty').
+    Results are memoized per schema string.
     """
     match = re.match(r'\[(.+)\]', schema_str)
     if not match:
-        return ['str', 'required']
+        return ('str', 'required')
     parts = [p.strip() for p in match.group(1).split('|')]
     dtype = parts[0]
     presence = parts[1] if len(parts) > 1 else 'required'
-    return [dtype, presence]
+    return (dtype, presence)
 
 
-def _type_ok(val: Any, dtype: str) -> bool:
+@functools.lru_cache(maxsize=1024)
+def _resolve_dtype(dtype: str) -> tuple | None:
     """
-    Return True if val matches any type in the dtype string.
+    Resolve a dtype string into the tuple of Python types it accepts.
     dtype examples: 'any', 'str', 'str,dict', 'list[str,dict]', 'int,float,bool', 'float'
-    'any'         - always passes, no type restriction.
-    'list[...]'   - only checks that val is a list (element types checked in _validate).
-    'float'       - accepts int values (JSON numbers are untyped).
-    bool is excluded from int matches to avoid Python's bool-is-int overlap.
+    'any'         - None, no type restriction.
+    'list[...]'   - (list,), element types are resolved separately.
+    'int'         - also accepts bool values (bool is a subclass of int).
+    'float'       - also accepts int values (JSON numbers are untyped), but not bool.
     """
     if dtype == 'any':
-        return True
+        return None
     if dtype.startswith('list['):
-        return isinstance(val, list)
+        return (list,)
+    types = []
     for t in (s.strip() for s in dtype.split(',')):
-        if t == 'bool' and isinstance(val, bool):
-            return True
-        if t == 'int' and isinstance(val, int) and not isinstance(val, bool):
-            return True
-        if t == 'float' and isinstance(val, (int, float)) and not isinstance(val, bool):
-            return True
-        if t in _TYPE_MAP and isinstance(val, _TYPE_MAP[t]):
-            return True
-    return False
-
-
-def _validate(
-    data: Any,
-    schema: dict,
-    violations: list[dict],
-    path: str = "",
-) -> None:
-    """Recursively walk *schema* and record violations found in *data*."""
-    if not isinstance(data, dict):
-        violations.append({"field": '/', "field_desc": "OPENEVAL ITEM IN JSON FORMAT", "violation_type": TypeError})
-        return
-
-    for sch_key, sch_value in schema.items():
-        field_path = f"{path}.{sch_key}" if path else sch_key
-
-        # --- leaf field: sch_value is a description ---
-        if isinstance(sch_value, str):
-            dtype, presence = _parse_constraints(sch_value)
-
-            if presence == 'auto':
-                continue
-
-            if presence == 'optional':
-                if sch_key not in data:
-                    continue
-                # present but wrong type
-                val = data[sch_key]
-                if val is not None and not _type_ok(val, dtype):
-                    violations.append({"field": field_path, "field_desc": sch_value, "violation_type": TypeError})
-                continue
+        if t == 'int':
+            types.extend((int, bool))
+        elif t == 'float':
+            types.extend((int, float))
+        elif t in _TYPE_MAP:
+            types.append(_TYPE_MAP[t])
+    return tuple(dict.fromkeys(types))
 
-            # presence is 'required' or 'non-empty'
-            if sch_key not in data:
-                violations.append({"field": field_path, "field_desc": sch_value, "violation_type": KeyError})
-                continue
 
-            val = data[sch_key]
+def _any(val: Any) -> bool:
+    return True
 
-            if presence == 'non-empty':
-                if val is None:
-                    violations.append({"field": field_path, "field_desc": sch_value, "violation_type": ValueError})
-                    continue
-                elif isinstance(val, (str, list)) and len(val) == 0:
-                    violations.append({"field": field_path, "field_desc": sch_value, "violation_type": ValueError})
-                    continue
 
-            if presence == 'required' and val is None:
-                continue
+@functools.lru_cache(maxsize=None)
+def _make_checker(allowed: tuple | None) -> Callable[[Any], bool]:
+    """
+    Build a predicate returning True if val is an instance of any of the *allowed* types (None allows anything).
+    bool is excluded from int matches unless listed in *allowed*, to avoid Python's bool-is-int overlap;
+    that decision is taken here once instead of per value.
+    Exact types (all JSON-decoded values) are matched by a type() identity lookup; isinstance
+    is only reached for subclasses and mismatches.
+    """
+    if allowed is None:
+        return _any
+    if len(allowed) == 1:
+        t = allowed[0]
+        return lambda val: type(val) is t or isinstance(val, t)
+    exact = frozenset(allowed)
+    if bool in allowed or int not in allowed:
+        return lambda val: type(val) in exact or isinstance(val, allowed)
+    return lambda val: type(val) in exact or (isinstance(val, allowed) and type(val) is not bool)
+
+
+def _exact_types(types: tuple | None) -> frozenset | None:
+    """
+    Return the frozenset of *types* for checking a whole list at once with
+    exact.issuperset(map(type, lst)), which runs entirely in C. A miss only means
+    the slow per-element check must run; None if elements need no type check.
+    """
+    return None if types is None else frozenset(types)
 
-            if not _type_ok(val, dtype):
-                violations.append({"field": field_path, "field_desc": sch_value, "violation_type": TypeError})
-                continue
 
-            if presence == 'non-empty' and isinstance(val, (str, list)) and len(val) == 0:
-                violations.append({"field": field_path, "field_desc": sch_value, "violation_type": ValueError})
+def _compile_schema(schema: dict, prefix: str = "") -> tuple:
+    """
+    Traverse *schema* once and flatten it into a tuple of _Instr records, so that
+    validation never has to re-parse schema strings. 'auto' fields are dropped.
+    Field paths are prebuilt from *prefix*; list templates restart from "" since
+    their elements' paths carry a runtime index.
+    """
+    program = []
+    for sch_key, sch_value in schema.items():
+        field_path = f"{prefix}.{sch_key}" if prefix else sch_key
+        # --- leaf field: sch_value is a description ---
+        if isinstance(sch_value, str):
+            dtype, presence = _parse_constraints(sch_value)
+            if presence == 'auto':
                 continue
-
-            # for list[inner] dtypes, also validate inner element types
+            kind = _OPTIONAL if presence == 'optional' else _REQUIRED
+            allowed = _resolve_dtype(dtype)
             if dtype.startswith('list['):
-                inner_dtype = dtype[5:-1]  # 'list[str,dict]' -> 'str,dict'
-                for i, elem in enumerate(val):
-                    if not _type_ok(elem, inner_dtype):
-                        violations.append({"field": f"{field_path}[{i}]", "field_desc": sch_value, "violation_type": TypeError})
+                elem_types = _resolve_dtype(dtype[5:-1])
+                elem_check = _make_checker(elem_types)
+            else:
+                elem_types = elem_check = None
+            program.append(_Instr(kind, sch_key, field_path, sch_value, allowed, _make_checker(allowed),
+                                  elem_types, elem_check, _exact_types(elem_types), presence == 'non-empty', ()))
 
         # --- nested mapping ---
         elif isinstance(sch_value, dict):
-            if sch_key not in data:
-                if sch_key in _OPTIONAL_DICT_KEYS:
-                    continue
-                violations.append({"field": field_path, "field_desc": sch_value, "violation_type": KeyError})
-                continue
-            if not isinstance(data[sch_key], dict):
-                violations.append({"field": field_path, "field_desc": sch_value, "violation_type": TypeError})
-                continue
-            _validate(data[sch_key], sch_value, violations, field_path)
+            kind = _OPTIONAL_DICT if sch_key in _OPTIONAL_DICT_KEYS else _DICT
+            program.append(_Instr(kind, sch_key, field_path, sch_value, (dict,), _make_checker((dict,)),
+                                  None, None, None, False, _compile_schema(sch_value, field_path)))
 
         # --- list field ---
         elif isinstance(sch_value, list) and sch_value:
-            if sch_key not in data:
-                violations.append({"field": field_path, "field_desc": sch_value, "violation_type": KeyError})
-                continue
-            if not isinstance(data[sch_key], list):
-                violations.append({"field": field_path, "field_desc": sch_value, "violation_type": TypeError})
-                continue
-
-            lst = data[sch_key]
             template = sch_value[0]
-
             if isinstance(template, str):   # currently idle
                 # list of scalars — template string encodes element constraints
                 dtype, presence = _parse_constraints(template)
-                if presence == 'non-empty' and len(lst) == 0:
-                    violations.append({"field": field_path, "field_desc": sch_value, "violation_type": ValueError})
-                for i, elem in enumerate(lst):
-                    elem_path = f"{field_path}[{i}]"
-                    if elem is None:
-                        violations.append({"field": elem_path, "field_desc": template, "violation_type": ValueError})
-                        continue
-                    if not _type_ok(elem, dtype):
-                        violations.append({"field": elem_path, "field_desc": template, "violation_type": TypeError})
-
+                elem_types = _resolve_dtype(dtype)
+                program.append(_Instr(_LIST, sch_key, field_path, sch_value, (list,), _make_checker((list,)),
+                                      elem_types, _make_checker(elem_types), _exact_types(elem_types),
+                                      presence == 'non-empty', ()))
             elif isinstance(template, dict):
                 # list of objects — non-empty check for designated keys
-                if sch_key in _NON_EMPTY_LIST_KEYS and len(lst) == 0:
-                    violations.append({"field": field_path, "field_desc": template, "violation_type": ValueError})
-                for i, elem in enumerate(lst):
-                    _validate(elem, template, violations, f"{field_path}[{i}]")
+                program.append(_Instr(_LIST_DICT, sch_key, field_path, sch_value, (list,), _make_checker((list,)),
+                                      None, None, None, sch_key in _NON_EMPTY_LIST_KEYS, _compile_schema(template)))
+    return tuple(program)
 
 
-def validate_entry(entry: dict) -> tuple[bool, list[dict]]:
+def _join_path(base: tuple | str, field_path: str) -> str:
+    """
+    Resolve *field_path* under *base* into a dot-path string.
+    *base* is "" at the top level, or a lazy (parent_base, list_path, index) tuple for a
+    list element, so walking list elements costs a small tuple instead of a formatted
+    string; only paths that end up in a violation are formatted.
+    """
+    if not base:
+        return field_path
+    parent, list_path, i = base
+    return f"{_join_path(parent, list_path)}[{i}].{field_path}"
+
+
+def _generate_source(program: tuple, ns: dict, mode: str = 'records') -> str:
+    """
+    Generate Python source for a validator specialized to the compiled *program*.
+    The result defines _v0(data, violations, base="") plus one sibling function per
+    list-of-dict template; nested mappings are inlined. Keys and field paths become
+    string literals, while field descriptions and type predicates are bound as
+    constants in *ns*. Violations are recorded in the order of a depth-first walk
+    of the entry in schema order, as the Cython runner (_validate_c.pyx) does.
+    *mode* selects what the code does at a violation:
+        'records'   - append a Violation record to the violations list
+        'columns'   - add it to a Violations buffer, column by column
+        'fail_fast' - raise _BadEntry, so neither records nor paths are built and
+                      the walk stops at the first violation
+    """
+    functions: list[list[str]] = []
+
+    def const(value: Any) -> str:
+        name = f"_k{len(ns)}"
+        ns[name] = value
+        return name
+
+    def add(lines: list[str], indent: str, field: str, desc: str, exc: str) -> None:
+        if mode == 'fail_fast':
+            lines.append(f'{indent}raise _BadEntry')
+        elif mode == 'columns':
+            lines.append(f'{indent}violations.add({field}, {desc}, {exc})')
+        else:
+            lines.append(f'{indent}violations.append(_new(Violation, ({field}, {desc}, {exc})))')
+
+    def function(prog: tuple) -> str:
+        name = f"_v{len(functions)}"
+        lines = [f'def {name}(data, violations, base=""):',
+                 '    if not isinstance(data, dict):']
+        functions.append(lines)
+        add(lines, '        ', "'/'", repr("OPENEVAL ITEM IN JSON FORMAT"), '_TE')
+        lines.append('        return')
+        plain(lines, '    ', 'data')
+        body(lines, prog, 'data', '    ', 0)
+        return name
+
+    def fetch(lines: list[str], indent: str, target: str, data: str, key: str, field: str, desc: str) -> None:
+        # look up a key that must be present; the caller's checks go in the else block.
+        # *data* is always a plain dict here, see plain()
+        lines.append(f'{indent}try:')
+        lines.append(f'{indent}    {target} = {data}[{key}]')
+        lines.append(f'{indent}except KeyError:')
+        add(lines, indent + '    ', field, desc, '_KE')
+        lines.append(f'{indent}else:')
+
+    def plain(lines: list[str], indent: str, data: str) -> None:
+        # the subscripts in fetch() would run __missing__ on a dict subclass (defaultdict),
+        # filling in absent keys of the caller's entry instead of reporting them. A
+        # dict.copy reads the raw items as dict.get does, without touching *data*
+        lines.append(f'{indent}if type({data}) is not dict:')
+        lines.append(f'{indent}    {data} = _copy({data})')
+
+    def body(lines: list[str], prog: tuple, data: str, indent: str, depth: int) -> None:
+        for ins in prog:
+            key = repr(ins.key)
+            # field paths are only resolved on the violation branches
+            field = f"_join_path(base, {ins.field_path!r})"
+            elem_field = f'{field} + f"[{{i}}]"'
+            desc = const(ins.field_desc)
+            kind = ins.kind
+
+            if kind == _OPTIONAL:
+                lines.append(f'{indent}val = {data}.get({key})')
+                lines.append(f'{indent}if val is not None and not {const(ins.check)}(val):')
+                add(lines, indent + '    ', field, desc, '_TE')
+
+            elif kind == _REQUIRED:
+                # required keys are nearly always present, and a subscript inside try
+                # is cheaper than dict.get; the except branch only runs for violations
+                fetch(lines, indent, 'val', data, key, field, desc)
+                inner = indent + '    '
+                lines.append(f'{inner}if val is None:')
+                if ins.needs_nonempty:
+                    add(lines, inner + '    ', field, desc, '_VE')
+                    lines.append(f'{inner}elif isinstance(val, (str, list)) and not val:')
+                    add(lines, inner + '    ', field, desc, '_VE')
+                else:
+                    lines.append(f'{inner}    pass')
+                lines.append(f'{inner}elif not {const(ins.check)}(val):')
+                add(lines, inner + '    ', field, desc, '_TE')
+                if ins.elem_exact is not None:
+                    lines.append(f'{inner}elif not {const(ins.elem_exact)}.issuperset(map(type, val)):')
+                    lines.append(f'{inner}    for i, elem in enumerate(val):')
+                    lines.append(f'{inner}        if not {const(ins.elem_check)}(elem):')
+                    add(lines, inner + '            ', elem_field, desc, '_TE')
+
+            elif kind == _DICT:
+                sub = f"data_{depth + 1}"
+                fetch(lines, indent, sub, data, key, field, desc)
+                lines.append(f'{indent}    if not isinstance({sub}, dict):')
+                add(lines, indent + '        ', field, desc, '_TE')
+                if ins.children:
+                    lines.append(f'{indent}    else:')
+                    plain(lines, indent + '        ', sub)
+                    body(lines, ins.children, sub, indent + '        ', depth + 1)
+
+            elif kind == _OPTIONAL_DICT:
+                # absence is the common case here, so keep the single get
+                sub = f"data_{depth + 1}"
+                lines.append(f'{indent}{sub} = {data}.get({key}, _MISSING)')
+                lines.append(f'{indent}if {sub} is _MISSING:')
+                lines.append(f'{indent}    pass')
+                lines.append(f'{indent}elif not isinstance({sub}, dict):')
+                add(lines, indent + '    ', field, desc, '_TE')
+                if ins.children:
+                    lines.append(f'{indent}else:')
+                    plain(lines, indent + '    ', sub)
+                    body(lines, ins.children, sub, indent + '    ', depth + 1)
+
+            else:   # _LIST or _LIST_DICT
+                template = const(ins.field_desc[0])
+                fetch(lines, indent, 'lst', data, key, field, desc)
+                inner = indent + '    '
+                lines.append(f'{inner}if not isinstance(lst, list):')
+                add(lines, inner + '    ', field, desc, '_TE')
+                lines.append(f'{inner}else:')
+                if ins.needs_nonempty:
+                    lines.append(f'{inner}    if not lst:')
+                    add(lines, inner + '        ', field, desc if kind == _LIST else template, '_VE')
+                if kind == _LIST:
+                    loop = inner + '    '
+                    if ins.elem_exact is not None:
+                        lines.append(f'{inner}    if not {const(ins.elem_exact)}.issuperset(map(type, lst)):')
+                        loop += '    '
+                    lines.append(f'{loop}for i, elem in enumerate(lst):')
+                    lines.append(f'{loop}    if elem is None:')
+                    add(lines, loop + '        ', elem_field, template, '_VE')
+                    lines.append(f'{loop}    elif not {const(ins.elem_check)}(elem):')
+                    add(lines, loop + '        ', elem_field, template, '_TE')
+                else:
+                    lines.append(f'{inner}    for i, elem in enumerate(lst):')
+                    lines.append(f'{inner}        {function(ins.children)}(elem, violations, (base, {ins.field_path!r}, i))')
+
+    function(program)
+    return "\n\n".join("\n".join(lines) for lines in functions) + "\n"
+
+
+def _build_validator(program: tuple, mode: str = 'records') -> Callable[..., None]:
+    """Compile the source generated for *program* and return its root function."""
+    # Violation records are created with tuple.__new__, skipping the named tuple's
+    # Python-level __new__; exception classes are bound as globals of the generated code
+    ns: dict = {"Violation": Violation, "_new": tuple.__new__, "_KE": KeyError, "_VE": ValueError, "_TE": TypeError,
+                "_MISSING": _MISSING, "_BadEntry": _BadEntry, "_join_path": _join_path,
+                "_copy": dict.copy}
+    source = _generate_source(program, ns, mode)
+    exec(_compile_cached(source), ns)
+    return ns["_v0"]
+
+
+def _compile_cached(source: str):
+    """
+    Compile generated validator *source*, reusing bytecode cached under _CACHE_DIR.
+    The cache file is keyed on the source itself and the interpreter's bytecode version,
+    so edits to the schema or to the generator never hit a stale entry. Compiling is
+    ~200x slower than loading the cached bytecode; cache I/O errors fall back to compiling.
+    Writing a new entry prunes the oldest ones, see _prune_cache.
+    """
+    digest = hashlib.sha256(importlib.util.MAGIC_NUMBER + source.encode()).hexdigest()
+    cache_path = os.path.join(_CACHE_DIR, f"validator-{digest[:32]}.bin")
+    try:
+        with open(cache_path, 'rb') as f:
+            return marshal.loads(f.read())
+    except (OSError, ValueError, EOFError, TypeError):
+        pass
+    code = compile(source, "<openeval validator>", "exec")
+    tmp_path = None
+    try:
+        os.makedirs(_CACHE_DIR, exist_ok=True)
+        # write to a temporary file first so concurrent processes never read a partial file
+        fd, tmp_path = tempfile.mkstemp(dir=_CACHE_DIR, prefix="validator-", suffix=".tmp")
+        with os.fdopen(fd, 'wb') as f:
+            f.write(marshal.dumps(code))
+        os.replace(tmp_path, cache_path)
+        tmp_path = None
+        _prune_cache()
+    except OSError:
+        if tmp_path is not None:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+    return code
+
+
+def _prune_cache() -> None:
+    """Delete all but the _CACHE_MAX_FILES most recently written validators under _CACHE_DIR."""
+    entries = []
+    for name in os.listdir(_CACHE_DIR):
+        if name.startswith("validator-") and name.endswith(".bin"):
+            path = os.path.join(_CACHE_DIR, name)
+            try:
+                entries.append((os.stat(path).st_mtime, path))
+            except OSError:   # removed by a concurrent prune
+                pass
+    entries.sort(reverse=True)
+    for _, path in entries[_CACHE_MAX_FILES:]:
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+
+def _load_validator(mode: str = 'records') -> Callable[..., None]:
+    """
+    Return the validator for *mode* (see _generate_source), called as validator(entry, violations).
+    The 'records' and 'fail_fast' modes run on the Cython runner if it has been built,
+    else (and 'columns' always) on the generated Python validator.
+    """
+    validator = _validator_cache.get(mode)
+    if validator is None:
+        program = _load_program()
+        if mode == 'records' and _run_compiled is not None:
+            validator = functools.partial(_run_compiled, program, Violation)
+        elif mode == 'fail_fast' and _run_compiled is not None:
+            validator = functools.partial(_run_compiled, program, Violation, stop=_BadEntry)
+        else:
+            validator = _build_validator(program, mode)
+            _warm(validator, program, mode)
+        _validator_cache[mode] = validator
+    return validator
+
+
+# one sample value per JSON type, for building a valid entry in _sample_entry
+_SAMPLE_VALUES = {str: "x", int: 0, float: 0.0, bool: False, dict: {}, list: ["x"]}
+
+
+def _sample_value(types: tuple | None) -> Any:
+    # unrecognized dtypes resolve to (), which no value satisfies
+    return _SAMPLE_VALUES[types[0]] if types else "x"
+
+
+def _sample_entry(program: tuple) -> dict:
+    """Build a minimal entry that satisfies *program*, with every non-optional leaf present."""
+    entry: dict = {}
+    for ins in program:
+        if ins.kind == _REQUIRED:
+            if ins.elem_types is not None:
+                entry[ins.key] = [_sample_value(ins.elem_types)]
+            else:
+                entry[ins.key] = _sample_value(ins.allowed_types)
+        elif ins.kind == _DICT or ins.kind == _OPTIONAL_DICT:
+            entry[ins.key] = _sample_entry(ins.children)
+        elif ins.kind == _LIST:
+            entry[ins.key] = [_sample_value(ins.elem_types)]
+        elif ins.kind == _LIST_DICT:
+            entry[ins.key] = [_sample_entry(ins.children)]
+    return entry
+
+
+def _warm(validator: Callable[..., None], program: tuple, mode: str) -> None:
+    """
+    Run a freshly built *validator* a few times on a valid sample entry and discard the
+    output. CPython 3.11+ specializes bytecode (dict subscripts, global loads, calls)
+    only after a code object has run several times, so without this the first entries
+    of a short corpus are validated by the generic, slower instructions.
+    This is only an optimization, so any error (e.g. a fail-fast validator rejecting a
+    sample that does not satisfy the schema) is ignored.
+    """
+    try:
+        entry = _sample_entry(program)
+        for _ in range(16):
+            validator(entry, Violations() if mode == 'columns' else [])
+    except Exception:
+        pass
+
+
+try:
+    # optional compiled runner of the schema program, see _validate_c.pyx
+    from _validate_c import INSTR_FIELDS, INSTR_KINDS, run as _run_compiled
+except ImportError:
+    _run_compiled = None
+else:
+    # the extension reads _Instr by position, so a build from an older layout would
+    # silently read the wrong fields
+    if INSTR_FIELDS != _Instr._fields or INSTR_KINDS != (_OPTIONAL, _REQUIRED, _DICT, _OPTIONAL_DICT, _LIST, _LIST_DICT):
+        _run_compiled = None
+
+
+def validate_entry(entry: dict) -> tuple[bool, list[Violation]]:
     """
     Validate a JSON entry against the OpenEval item schema:
     1) Fields whose schema description starts with [AUTO] are system-generated and not required from the contributor.
@@ -191,7 +591,7 @@ def validate_entry(entry: dict) -> tuple[bool, list[dict]]:
     Returns:
         (is_valid, violations)
         - is_valid:   True when no violations were found.
-        - violations: List of violation dicts, each with keys:
+        - violations: List of Violation records (named tuples; formerly dicts), each with fields:
             *field*          – dot-path to the problematic key
                                 (e.g. 'item_metadata.contributor.email')
             *field_desc*     – corresponding value of the
@@ -200,26 +600,125 @@ def validate_entry(entry: dict) -> tuple[bool, list[dict]]:
                                 (KeyError: missing fields, ValueError: null values or
                                 empty '_content'/'responses' lists, TypeError: wrong types)
     """
-    schema = _load_schema()
-    violations: list[dict] = []
-    _validate(entry, schema, violations)
-    return len(violations) == 0, violations
+    violations: list[Violation] = []
+    _load_validator()(entry, violations)
+    return not violations, violations
+
+
+def is_valid(entry: dict) -> bool:
+    """
+    Return True if *entry* passes validation against the OpenEval item schema.
+    Equivalent to validate_entry(entry)[0], but stops at the first violation without
+    describing it, so rejecting an invalid entry is faster (e.g. when filtering a corpus);
+    a valid entry takes about as long as with validate_entry.
+    """
+    try:
+        _load_validator('fail_fast')(entry, None)
+    except _BadEntry:
+        return False
+    return True
+
+
+def validate_entries(entries: list[dict]) -> list[tuple[bool, list[Violation]]]:
+    """
+    Validate a batch of JSON entries against the OpenEval item schema.
+    Equivalent to [validate_entry(e) for e in entries], with the validator looked up once.
+
+    Args:
+        entries: The item entry dicts to validate.
+
+    Returns:
+        One (is_valid, violations) tuple per entry, as returned by validate_entry.
+    """
+    validator = _load_validator()
+    results = []
+    for entry in entries:
+        violations: list[Violation] = []
+        validator(entry, violations)
+        results.append((not violations, violations))
+    return results
+
+
+def collect_violations(entries: list[dict]) -> Violations:
+    """
+    Validate a batch of JSON entries and gather all their violations into one columnar
+    Violations buffer, e.g. for corpus-level reports such as Counter(violations.excs).
+
+    Args:
+        entries: The item entry dicts to validate.
+
+    Returns:
+        A Violations buffer; its *items* column holds the index of the entry each
+        violation belongs to.
+    """
+    validator = _load_validator('columns')
+    out = Violations()
+    items, fields = out.items, out.fields
+    for i, entry in enumerate(entries):
+        n = len(fields)
+        validator(entry, out)
+        if len(fields) > n:
+            items.extend([i] * (len(fields) - n))
+    return out
+
+
+def _ijson_entries(f, file_path: str) -> Iterator[Any]:
+    """Yield the elements of the top-level JSON array in *f*, raising ijson errors as ValueError."""
+    # use_float: decode non-integral numbers as float, as json.load does, not Decimal
+    events = ijson.parse(f, use_float=True)
+    try:
+        if next(events)[1] != 'start_array':
+            raise ValueError(f"{file_path}: expected a top-level JSON array of item entries")
+        yield from ijson.items(events, 'item')
+    except ijson.JSONError as exc:
+        # as for json.load in validate_stream, so callers see one error type either way
+        raise ValueError(f"{file_path}: invalid JSON: {exc}") from exc
+
+
+def validate_stream(file_path: str) -> Iterator[tuple[bool, list[Violation]]]:
+    """
+    Validate the entries of a JSON (top-level array) or JSONL file one at a time, so
+    only the entry being checked is held in memory rather than the whole file.
+    JSON arrays are read incrementally with ijson when it is installed; without it
+    the file is decoded in full first. The results are the same, except that ijson's
+    C backend rejects numbers that json.load still decodes (1e400, integers beyond 64 bits).
+
+    Args:
+        file_path: Path to a .json or .jsonl file of item entries.
+
+    Yields:
+        One (is_valid, violations) tuple per entry, in file order, as returned by validate_entry.
+
+    Raises:
+        ValueError: If a .json file is not valid JSON or its top-level value is not an
+                    array, or a line of a .jsonl file is not valid JSON. With ijson, entries
+                    before the error have already been yielded.
+    """
+    validator = _load_validator()
+    with open(file_path, 'rb') as f:
+        if file_path.endswith('.jsonl'):
+            entries = jsonlines.Reader(f)
+        elif ijson is not None:
+            entries = _ijson_entries(f, file_path)
+        else:
+            try:
+                entries = json.load(f)
+            except json.JSONDecodeError as exc:
+                raise ValueError(f"{file_path}: invalid JSON: {exc}") from exc
+            if not isinstance(entries, list):
+                raise ValueError(f"{file_path}: expected a top-level JSON array of item entries")
+        for entry in entries:
+            violations: list[Violation] = []
+            validator(entry, violations)
+            yield not violations, violations
 
 
 if __name__ == '__main__':
-    # load your item examples
+    # your item examples (.json or .jsonl)
     file_path = 'item_examples.json'
-    if file_path.endswith('.jsonl'):   # jsonl
-        with jsonlines.open(file_path, 'r') as f:
-            examples = [o for o in f]
-    else:   # json
-        assert file_path.endswith('.json')
-        with open(file_path, 'r') as f:
-            examples = json.load(f)
 
     # validate the examples and print violations
-    for i, e in enumerate(examples):
-        res, vios = validate_entry(e)
+    for i, (res, vios) in enumerate(validate_stream(file_path)):
         if not res:
             print(f'Item #{i}')
             for j, v in enumerate(vios):